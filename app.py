@@ -1,42 +1,140 @@
 """
-Flask web application for Uber Eats menu scraper
+Quart web application for Uber Eats menu scraper
 
 This module provides a REST API and web interface for scraping Uber Eats
 restaurant menus. It includes endpoints for scraping, health checks, and
-serving the web interface.
+serving the web interface. Quart keeps the Flask API but runs on ASGI, so
+concurrent scrapes share one event loop instead of each blocking a thread.
 
 Author: Steven Wang
 Date: 2025-09-05
 Version: 1.0.0
 """
 
-from flask import Flask, render_template, request, jsonify, url_for
-from flask_cors import CORS
-import json
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+import orjson
+import redis.asyncio as redis
+from quart import Quart, Response, render_template, request
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import cors
+
+from config import REDIS_URL, CACHE_TTL, SCRAPER_POOL_SIZE
 from scraper import UberEatsScraper
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend requests
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which encodes menu payloads far faster than stdlib json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class ScraperApp(Quart):
+    """Quart app that serializes JSON with orjson"""
+    json_provider_class = ORJSONProvider
+
+
+# Initialize Quart app
+app = ScraperApp(__name__)
+app = cors(app)  # Enable CORS for frontend requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global scraper instance (will be initialized per request)
-scraper = None
+# Shared HTTP client (opened when the server starts serving)
+http_client = None
+
+# Cache of scrape results keyed by normalized URL (connects lazily)
+cache = redis.Redis.from_url(REDIS_URL)
+
+# Reusable scrapers; each keeps its Chrome warm once the browser fallback starts it
+scraper_pool = None
+
+
+# Response envelopes serialized once; only the variable fields are filled in per request
+_HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":"%b","version":"1.0.0"}'
+_SUCCESS_TEMPLATE = b'{"success":true,"data":%b,"error":null,"timestamp":"%b"}'
+_ERROR_TEMPLATE = b'{"success":false,"data":null,"error":%b,"timestamp":"%b"}'
+
+
+def _timestamp():
+    """Current time formatted for API responses"""
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _error(message, status_code):
+    """Build a JSON error response"""
+    body = _ERROR_TEMPLATE % (orjson.dumps(message), _timestamp().encode())
+    return Response(body, status=status_code, mimetype='application/json')
+
+
+def _normalize_url(url):
+    """Normalize a store URL for cache lookups (drop query/fragment, lowercase host)"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+
+def _cache_key(url):
+    """Redis key for a scrape result"""
+    digest = hashlib.blake2b(_normalize_url(url).encode(), digest_size=16).hexdigest()
+    return f"ue:{digest}"
+
+
+def _success_response(result_json):
+    """Wrap already-serialized result bytes in the success envelope without re-encoding them"""
+    body = _SUCCESS_TEMPLATE % (result_json, _timestamp().encode())
+    return Response(body, mimetype='application/json')
+
+
+@app.before_serving
+async def open_http_client():
+    """Create the shared HTTP client so connections are reused across scrapes"""
+    global http_client
+    http_client = httpx.AsyncClient()
+
+
+@app.after_serving
+async def close_http_client():
+    """Close the shared HTTP client and cache connection"""
+    await http_client.aclose()
+    await cache.aclose()
+
+
+@app.before_serving
+async def open_scraper_pool():
+    """Fill the scraper pool (Chrome is only launched when a scraper first needs it)"""
+    global scraper_pool
+    scraper_pool = asyncio.Queue()
+    for _ in range(SCRAPER_POOL_SIZE):
+        scraper_pool.put_nowait(UberEatsScraper())
+
+
+@app.after_serving
+async def close_scraper_pool():
+    """Shut down every pooled scraper's WebDriver"""
+    loop = asyncio.get_running_loop()
+    while not scraper_pool.empty():
+        await loop.run_in_executor(None, scraper_pool.get_nowait().close)
 
 
 @app.route('/')
-def index():
+async def index():
     """Serve the main HTML page"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 
 @app.route('/api/scrape', methods=['POST'])
-def scrape_menu():
+async def scrape_menu():
     """
     API endpoint for scraping Uber Eats menu
     
@@ -53,129 +151,94 @@ def scrape_menu():
         "timestamp": "2025-01-01 12:00:00"
     }
     """
-    global scraper
-    
     try:
         # Get JSON data from request
-        data = request.get_json()
+        data = await request.get_json()
         
         if not data:
-            return jsonify({
-                'success': False,
-                'data': None,
-                'error': 'No JSON data provided',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }), 400
+            return _error('No JSON data provided', 400)
         
         url = data.get('url', '').strip()
         
         if not url:
-            return jsonify({
-                'success': False,
-                'data': None,
-                'error': 'URL is required',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }), 400
+            return _error('URL is required', 400)
         
         # Validate URL format
         if 'ubereats.com' not in url:
-            return jsonify({
-                'success': False,
-                'data': None,
-                'error': 'Please provide a valid Uber Eats URL',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }), 400
+            return _error('Please provide a valid Uber Eats URL', 400)
+        
+        # Serve repeat requests for the same store from the cache
+        key = _cache_key(url)
+        try:
+            cached = await cache.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache lookup failed: {str(e)}")
+            cached = None
+        
+        if cached:
+            logger.info(f"Cache hit for URL: {url}")
+            return _success_response(cached)
         
         logger.info(f"Starting scrape for URL: {url}")
         
-        # Initialize scraper
-        scraper = UberEatsScraper()
+        # Borrow a scraper from the pool (waits if all are busy)
+        scraper = await scraper_pool.get()
         
         try:
             # Scrape the restaurant
-            result = scraper.scrape_restaurant(url)
+            result = await scraper.scrape_restaurant_async(http_client, url)
             
             # Check if scraping was successful
             if 'error' in result:
-                return jsonify({
-                    'success': False,
-                    'data': None,
-                    'error': result['error'],
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }), 500
+                return _error(result['error'], 500)
             
-            # Return successful result
-            return jsonify({
-                'success': True,
-                'data': result,
-                'error': None,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            })
+            # Cache only results that found a menu; empty scrapes (e.g. a slow
+            # page load) are retried on the next request
+            result_json = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+            if result['menu_items']:
+                try:
+                    await cache.setex(key, CACHE_TTL, result_json)
+                except redis.RedisError as e:
+                    logger.warning(f"Cache store failed: {str(e)}")
+            
+            return _success_response(result_json)
             
         finally:
-            # Always clean up scraper
-            if scraper:
-                scraper.close()
-                scraper = None
+            # Always clear session state and return the scraper; only a started
+            # WebDriver has state to clear (its calls block, so run off the loop)
+            if scraper.driver is not None:
+                await asyncio.get_running_loop().run_in_executor(None, scraper.reset)
+            scraper_pool.put_nowait(scraper)
     
     except Exception as e:
         logger.error(f"Error in scrape_menu: {str(e)}")
         
-        # Clean up scraper on error
-        if scraper:
-            try:
-                scraper.close()
-            except:
-                pass
-            scraper = None
-        
-        return jsonify({
-            'success': False,
-            'data': None,
-            'error': f'Internal server error: {str(e)}',
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }), 500
+        return _error(f'Internal server error: {str(e)}', 500)
 
 
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'version': '1.0.0'
-    })
+    return Response(_HEALTH_TEMPLATE % _timestamp().encode(), mimetype='application/json')
 
 
 @app.errorhandler(404)
-def not_found(error):
+async def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Endpoint not found',
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }), 404
+    return _error('Endpoint not found', 404)
 
 
 @app.errorhandler(500)
-def internal_error(error):
+async def internal_error(error):
     """Handle 500 errors"""
     logger.error(f"Internal server error: {str(error)}")
-    return jsonify({
-        'success': False,
-        'error': 'Internal server error',
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }), 500
+    return _error('Internal server error', 500)
 
 
 @app.errorhandler(405)
-def method_not_allowed(error):
+async def method_not_allowed(error):
     """Handle 405 errors"""
-    return jsonify({
-        'success': False,
-        'error': 'Method not allowed',
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }), 405
+    return _error('Method not allowed', 405)
 
 
 if __name__ == '__main__':
@@ -185,5 +248,6 @@ if __name__ == '__main__':
     print("   • POST /api/scrape - Scrape Uber Eats menu")
     print("   • GET  /api/health - Health check")
     print("🌐 Server will be available at: http://localhost:5001")
+    print("💡 For production use: uvicorn app:app --workers 4 --loop uvloop --port 5001")
     
     app.run(debug=True, host='0.0.0.0', port=5001)
@@ -9,20 +9,21 @@ Date: 2025-09-05
 Version: 1.0.0
 """
 
+import os
+
 # Chrome WebDriver options for browsing (optimized for speed)
 CHROME_OPTIONS = [
     '--no-sandbox',
     '--disable-dev-shm-usage',
-    '--disable-gpu',
     '--window-size=1920,1080',
     '--disable-blink-features=AutomationControlled',
     '--disable-extensions',
     '--disable-plugins',
-    '--headless',  # Enable headless mode for production
-    '--disable-images',  # Disable images for faster loading
+    '--headless=new',  # New headless mode: faster startup, lower memory than legacy
+    '--blink-settings=imagesEnabled=false',  # Skip image bytes; <img src> attributes are still readable
     # '--disable-javascript',  # Keep JS enabled for Uber Eats dynamic content
     '--disable-web-security',
-    '--disable-features=VizDisplayCompositor',
+    '--disable-features=VizDisplayCompositor,Translate,OptimizationHints,MediaRouter',  # Chrome only honors one --disable-features
     '--disable-background-timer-throttling',
     '--disable-backgrounding-occluded-windows',
     '--disable-renderer-backgrounding',
@@ -47,19 +48,59 @@ CHROME_OPTIONS = [
     '--disable-ipc-flooding-protection',
     '--aggressive-cache-discard',
     '--memory-pressure-off',
-    '--max_old_space_size=4096'
+    '--remote-debugging-port=0'  # Pick a free DevTools port so parallel instances don't collide
 ]
 
+# Chrome content settings (2 = block); the scraper only needs DOM text and image URLs
+CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.fonts': 2,
+    'profile.default_content_setting_values.notifications': 2
+}
+
+# Return from driver.get() once the DOM is interactive instead of waiting for every subresource
+PAGE_LOAD_STRATEGY = 'eager'
+
 # Chrome binary path for macOS
 CHROME_BINARY_PATH = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
 
+# Prebuilt chromedriver to use instead of resolving one with webdriver-manager
+CHROMEDRIVER_PATH = os.environ.get('CHROMEDRIVER_PATH')
+
 # User agent to mimic real browser
 USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
+# Requests blocked via Chrome DevTools Protocol: analytics, tracking, ads and
+# fonts are not needed to read the menu
+BLOCKED_URL_PATTERNS = [
+    '*.googletagmanager.com/*',
+    '*.doubleclick.net/*',
+    '*google-analytics*',
+    '*/fonts/*',
+    '*.woff2',
+    '*sentry*',
+    '*segment.io*',
+    '*branch.io*',
+    '*facebook.com/tr*',
+    # Menu image bytes; their URLs are still read from the <img src> attributes
+    '*tb-static.uber.com/*.jpg',
+    '*tb-static.uber.com/*.jpeg'
+]
+
 # Timeouts and delays (optimized for speed)
 PAGE_LOAD_TIMEOUT = 30
-IMPLICIT_WAIT = 5
-SCROLL_PAUSE_TIME = 2
+SCROLL_BACKOFF_DELAYS = (0.2, 0.4, 0.8, 1.5)  # Max wait for new items after each successive scroll
+REQUEST_TIMEOUT = 15  # HTTP fetch of the store page
+PAGE_READY_TIMEOUT = 15  # Max wait for the document to leave readyState "loading"
+MENU_WAIT_TIMEOUT = 10  # Max wait for menu items to render
+WAIT_POLL_INTERVAL = 0.1  # Poll interval for explicit waits
+
+# Redis cache for scrape results (menus change hourly, not per second)
+REDIS_URL = 'redis://localhost:6379/0'
+CACHE_TTL = 900  # 15 minutes
+
+# Scrapers kept per server process; each may hold a warm Chrome instance
+SCRAPER_POOL_SIZE = 4
 
 # CSS selectors for Uber Eats elements (optimized for speed and accuracy)
 SELECTORS = {
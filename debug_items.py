@@ -3,6 +3,7 @@
 Debug script to output menu items for manual verification
 """
 
+import logging
 import sys
 from scraper import UberEatsScraper
 
@@ -50,4 +51,5 @@ if __name__ == "__main__":
         sys.exit(1)
     
     url = sys.argv[1]
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     debug_menu_items(url)
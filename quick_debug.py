@@ -3,37 +3,33 @@
 Quick debug script to just show item names
 """
 
+import logging
 import sys
-from scraper import UberEatsScraper
+from scraper import UberEatsScraper, _ITEM_ROWS_JS, _ITEM_SELECTOR
 
 def quick_debug(url):
     """Quickly extract and display just the item names"""
     print("🚀 Quick debug - extracting item names...")
     
-    scraper = UberEatsScraper()
+    scraper = UberEatsScraper(use_browser=True)
     
     try:
         scraper.driver.get(url)
-        scraper._handle_popups()
+        scraper._close_popup()
         scraper._scroll_to_load_all_items()
         
-        # Get all menu item elements
-        elements = scraper.driver.find_elements('css selector', 'a[href*="item"]')
-        print(f"📋 Found {len(elements)} elements")
+        # Get the text of all menu item elements in one call
+        rows = scraper.driver.execute_script(_ITEM_ROWS_JS, _ITEM_SELECTOR)
+        print(f"📋 Found {len(rows)} elements")
         print("=" * 50)
         
         # Extract just the names quickly
         names = []
-        for i, element in enumerate(elements):
-            try:
-                text = element.text.strip()
-                if text:
-                    # Simple name extraction - just take the first line
-                    first_line = text.split('\n')[0].strip()
-                    if first_line and not first_line.startswith('$'):
-                        names.append(f"{i+1:3d}. {first_line}")
-            except:
-                names.append(f"{i+1:3d}. [ERROR EXTRACTING]")
+        for text, _, index in rows:
+            # Simple name extraction - just take the first line
+            lines = [line.strip() for line in text.split('\n') if line.strip()]
+            if lines and not lines[0].startswith('$'):
+                names.append(f"{index+1:3d}. {lines[0]}")
         
         # Display all names
         for name in names:
@@ -54,4 +50,5 @@ if __name__ == "__main__":
         sys.exit(1)
     
     url = sys.argv[1]
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     quick_debug(url)
@@ -3,6 +3,8 @@ Core scraping logic for Uber Eats restaurant pages
 
 This module provides the UberEatsScraper class that can extract menu items
 from Uber Eats restaurant pages, including names, prices, descriptions, and images.
+Menus are read from the store JSON embedded in the page HTML, with Selenium
+kept as a fallback for pages where that data is missing.
 It handles deduplication and validates image URLs.
 
 Author: Steven Wang
@@ -10,27 +12,209 @@ Date: 2025-09-05
 Version: 1.0.0
 """
 
+import asyncio
+import base64
+import logging
+import re
+import tempfile
 import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+from urllib.parse import unquote, urljoin, urlparse
+
+import httpx
+import orjson
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from config import CHROME_OPTIONS, USER_AGENT, PAGE_LOAD_TIMEOUT, IMPLICIT_WAIT, SELECTORS, PLACEHOLDER_PATTERNS, CHROME_BINARY_PATH
+from config import CHROME_OPTIONS, USER_AGENT, PAGE_LOAD_TIMEOUT, SELECTORS, PLACEHOLDER_PATTERNS, CHROME_BINARY_PATH, CHROMEDRIVER_PATH, CHROME_PREFS, PAGE_LOAD_STRATEGY, REQUEST_TIMEOUT, BLOCKED_URL_PATTERNS, MENU_WAIT_TIMEOUT, WAIT_POLL_INTERVAL, PAGE_READY_TIMEOUT, SCROLL_BACKOFF_DELAYS
+
+logger = logging.getLogger(__name__)
+
+# Store pages embed the full Redux state (including the menu) as JSON
+_REDUX_STATE_RE = re.compile(r'<script[^>]*id="__REDUX_STATE__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# chromedriver path, taken from CHROMEDRIVER_PATH if set, otherwise resolved by
+# webdriver-manager and cached after the first install
+_DRIVER_PATH = CHROMEDRIVER_PATH
+
+# Headers for plain HTTP fetches of store pages
+_REQUEST_HEADERS = {'User-Agent': USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'}
+
+# Name selectors split once at import so they can be tried in order
+_NAME_SELECTORS = tuple(s.strip() for s in SELECTORS['restaurant_name'].split(','))
+
+# Menu item selector, also serialised once as a JS string literal for the
+# CDP expression in _SCROLL_AND_COUNT_JS
+_ITEM_SELECTOR = SELECTORS['menu_items']
+_ITEM_SELECTOR_JS = orjson.dumps(_ITEM_SELECTOR).decode()
+
+# Number of elements matching the CSS selector in arguments[0]; one int
+# crosses the wire instead of a handle per element
+_COUNT_ITEMS_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+# Scrolls to the bottom, then polls in the page until the number of elements
+# matching the selector moves off the previous count or the timeout passes,
+# and resolves to the new count. Evaluated through CDP so the scroll, the wait
+# and the count are a single round trip.
+_SCROLL_AND_COUNT_JS = """
+(async () => {
+    const count = () => document.querySelectorAll(%(selector)s).length;
+    window.scrollTo(0, document.body.scrollHeight);
+    const deadline = performance.now() + %(timeout_ms)d;
+    while (count() === %(prev_count)d && performance.now() < deadline) {
+        await new Promise((resolve) => setTimeout(resolve, %(poll_ms)d));
+    }
+    return count();
+})()
+"""
+
+# First non-empty text among the selectors in arguments[0], tried in order
+_FIRST_TEXT_JS = """
+    for (const sel of arguments[0]) {
+        const el = document.querySelector(sel);
+        const text = el ? el.textContent.trim() : '';
+        if (text) {
+            return text;
+        }
+    }
+    return '';
+"""
+
+# Clicks the delivery/schedule popup's close button if one is present and
+# reports whether it did
+_CLOSE_POPUP_JS = """
+    const button = document.querySelector('button[aria-label="Close"], button[data-testid="close-button"]');
+    if (button) {
+        button.click();
+        return true;
+    }
+    return false;
+"""
+
+# Dollar amount in a line such as "$12.99 • 540 Cal." or "$1,299.00"
+_PRICE_RE = re.compile(r'\$\s*(\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?|\d+(?:\.\d{1,2})?)')
+
+# Lines that never hold an item name: prices, rank tags, badges and size options
+_SKIP_PREFIXES = ('$', '#', 'Popular', 'most liked', 'Plus small')
+
+# Returns [text, image src, index] for every element matching the CSS selector in
+# arguments[0] in a single round trip, capped in-browser at the optional
+# limit in arguments[1]. innerText keeps the rendered line breaks so each
+# visible line can be parsed separately. When skip prefixes are passed in
+# arguments[2], items whose exact name (picked as in _parse_lines) was
+# already seen are dropped in the browser and never cross the wire; case
+# folding is left to _parse_lines. index is the element's position among the
+# matches, so it is unaffected by the dropped rows. Image sources
+# are the raw src attribute (lazy images without one are skipped), so
+# they are resolved against the page URL in Python.
+_ITEM_ROWS_JS = """
+    var els = Array.from(document.querySelectorAll(arguments[0]));
+    if (arguments[1] != null) {
+        els = els.slice(0, arguments[1]);
+    }
+    var skipPrefixes = arguments[2];
+    var seen = new Set();
+    var rows = [];
+    els.forEach(function(el, index) {
+        var text = el.innerText;
+        if (skipPrefixes) {
+            var lines = text.split('\\n').map(function(line) { return line.trim(); }).filter(Boolean);
+            var name = lines.find(function(line) {
+                return line.length > 1 && !skipPrefixes.some(function(p) { return line.startsWith(p); });
+            }) || lines[0];
+            if (name === undefined) {
+                return;
+            }
+            if (seen.has(name)) {
+                return;
+            }
+            seen.add(name);
+        }
+        var img = el.querySelector('img[src]');
+        rows.push([text, img ? img.getAttribute('src') : '', index]);
+    });
+    return rows;
+"""
+
+# Image URL checks compiled once so each URL is scanned in a single C-level pass
+# (case-insensitive, so URLs are not lowercased first)
+_PLACEHOLDER_RE = re.compile('|'.join(re.escape(p) for p in PLACEHOLDER_PATTERNS + ['data:image']), re.IGNORECASE)
+_IMAGE_EXT_RE = re.compile(r'\.(jpe?g|png|webp|gif)(?:$|\?)', re.IGNORECASE)
+# Uber Eats CDN images, valid by structure (case-sensitive by URL convention)
+_UBER_CDN_IMAGE_RE = re.compile(r'tb-static\.uber\.com.*processed_images')
+
+
+def _parse_lines(full_text: str, seen_items: set[str]) -> Optional[tuple[str, str, str]]:
+    """
+    Split a menu item's text into (name, price, description)
+    
+    Pure string code with no WebDriver access, so it can be compiled with
+    mypyc. Returns None for empty text and for names already in seen_items
+    (compared casefolded); new names are added to seen_items casefolded.
+    """
+    # Single pass over the raw lines: strip each once, take the first price
+    # and collect name/description lines, stopping as soon as the name
+    # (first kept line) is a duplicate
+    first = ""
+    price = ""
+    bodies: list[str] = []
+    for line in full_text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if not first:
+            first = line
+        
+        if not price:
+            match = _PRICE_RE.search(line)
+            if match:
+                price = f"${match.group(1)}"
+        
+        if len(line) < 2 or line.startswith(_SKIP_PREFIXES):
+            continue
+        if not bodies and line.casefold() in seen_items:
+            return None
+        bodies.append(line)
+    
+    # First body line is the name, later distinct lines are the description
+    if not first:
+        return None
+    name = bodies[0] if bodies else first  # Fallback to first line
+    key = name.casefold()
+    if key in seen_items:
+        return None
+    seen_items.add(key)
+    description = ' • '.join(line for line in bodies[1:] if line != name)
+    
+    return name, price, description
 
 
 class UberEatsScraper:
-    def __init__(self):
-        """Initialize WebDriver with Chrome options"""
+    def __init__(self, use_browser=False, user_data_dir=None):
+        """
+        Initialize the scraper
+        
+        Args:
+            use_browser (bool): Always scrape with Selenium instead of the
+                embedded store JSON. The WebDriver is otherwise only started
+                if the JSON path fails.
+            user_data_dir (str): Chrome profile directory; give each
+                concurrently running Chrome its own
+        """
+        self.use_browser = use_browser
+        self.user_data_dir = user_data_dir
         self.driver = None
-        self.wait = None
-        self._setup_driver()
+        if use_browser:
+            self._setup_driver()
     
     def _setup_driver(self):
         """Set up Chrome WebDriver with configured options"""
+        global _DRIVER_PATH
         chrome_options = Options()
         
         # Add all Chrome options
@@ -40,31 +224,47 @@ class UberEatsScraper:
         # Set user agent
         chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         
+        # Separate profile so several Chrome instances can run side by side
+        if self.user_data_dir:
+            chrome_options.add_argument(f'--user-data-dir={self.user_data_dir}')
+        
+        # Block images, fonts and notifications; return once the DOM is interactive
+        chrome_options.add_experimental_option('prefs', CHROME_PREFS)
+        chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+        
         # Set Chrome binary path
         chrome_options.binary_location = CHROME_BINARY_PATH
         
         try:
-            # Try to initialize driver with webdriver-manager
-            service = Service(ChromeDriverManager().install())
+            # Try to initialize driver with webdriver-manager (version lookup hits the network, so only once)
+            if _DRIVER_PATH is None:
+                _DRIVER_PATH = ChromeDriverManager().install()
+            service = Service(_DRIVER_PATH)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
         except Exception as e:
-            print(f"⚠️ WebDriver manager failed: {str(e)}")
-            print("🔄 Trying to use system Chrome driver...")
+            logger.warning("⚠️ WebDriver manager failed: %s", e)
+            logger.info("🔄 Trying to use system Chrome driver...")
             try:
                 # Fallback to system Chrome driver
                 self.driver = webdriver.Chrome(options=chrome_options)
             except Exception as e2:
-                print(f"❌ System Chrome driver also failed: {str(e2)}")
-                print("💡 Please ensure Chrome is installed and chromedriver is in PATH")
+                logger.error("❌ System Chrome driver also failed: %s", e2)
+                logger.info("💡 Please ensure Chrome is installed and chromedriver is in PATH")
                 raise e2
         
+        # No implicit wait: lookups for absent elements fail fast, readiness uses explicit waits
         self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-        self.driver.implicitly_wait(IMPLICIT_WAIT)
         
-        # Set up wait object
-        self.wait = WebDriverWait(self.driver, IMPLICIT_WAIT)
+        # Block analytics, ads and fonts at the network layer; keep the HTTP
+        # cache on so a pooled driver reuses assets between scrapes
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            self.driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+        except Exception as e:
+            logger.warning("⚠️ Could not set up request blocking: %s", e)
         
-        print("✅ WebDriver initialized successfully")
+        logger.info("✅ WebDriver initialized successfully")
     
     def scrape_restaurant(self, url):
         """
@@ -76,29 +276,210 @@ class UberEatsScraper:
         Returns:
             dict: Scraped restaurant data including menu items
         """
+        if not self.use_browser:
+            try:
+                restaurant_data = self._scrape_from_json(url)
+                if restaurant_data:
+                    return restaurant_data
+                logger.warning("⚠️ No menu found in store JSON, falling back to browser")
+            except Exception as e:
+                logger.warning("⚠️ Store JSON fetch failed: %s, falling back to browser", e)
+        
+        return self._scrape_with_browser(url)
+    
+    async def scrape_restaurant_async(self, client, url):
+        """
+        Async variant of scrape_restaurant for use inside an event loop
+        
+        Args:
+            client (httpx.AsyncClient): Shared HTTP client for the store fetch
+            url (str): Uber Eats restaurant URL
+            
+        Returns:
+            dict: Scraped restaurant data including menu items
+        """
+        if not self.use_browser:
+            try:
+                logger.info("🌐 Fetching store data: %s", url)
+                response = await client.get(url, headers=_REQUEST_HEADERS, timeout=REQUEST_TIMEOUT, follow_redirects=True)
+                response.raise_for_status()
+                restaurant_data = self._restaurant_data_from_state(url, self._parse_store_state(response.text))
+                if restaurant_data:
+                    return restaurant_data
+                logger.warning("⚠️ No menu found in store JSON, falling back to browser")
+            except Exception as e:
+                logger.warning("⚠️ Store JSON fetch failed: %s, falling back to browser", e)
+        
+        # Selenium is blocking, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._scrape_with_browser, url)
+    
+    def _scrape_from_json(self, url):
+        """
+        Scrape restaurant data from the store JSON embedded in the page
+        
+        Args:
+            url (str): Uber Eats restaurant URL
+            
+        Returns:
+            dict: Scraped restaurant data, or None if no menu was found
+        """
+        logger.info("🌐 Fetching store data: %s", url)
+        return self._restaurant_data_from_state(url, self._fetch_store_json(url))
+    
+    def _restaurant_data_from_state(self, url, state):
+        """Build the restaurant result from decoded Redux state, or None if no menu was found"""
+        store = self._find_store(state, url)
+        if not store:
+            return None
+        
+        menu_items = self._extract_menu_items_from_json(store)
+        if not menu_items:
+            return None
+        
+        restaurant_data = {
+            'url': url,
+            'restaurant_name': self._extract_restaurant_name_from_json(store),
+            'menu_items': menu_items,
+            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        logger.info("✅ Successfully scraped %d menu items", len(menu_items))
+        return restaurant_data
+    
+    def _fetch_store_json(self, url):
+        """Fetch the store page and decode its embedded __REDUX_STATE__ JSON"""
+        response = httpx.get(url, headers=_REQUEST_HEADERS, timeout=REQUEST_TIMEOUT, follow_redirects=True)
+        response.raise_for_status()
+        return self._parse_store_state(response.text)
+    
+    def _parse_store_state(self, html):
+        """Extract and decode the __REDUX_STATE__ JSON from store page HTML"""
+        match = _REDUX_STATE_RE.search(html)
+        if not match:
+            raise ValueError("__REDUX_STATE__ not found in page")
+        
+        raw_state = match.group(1).strip()
+        # The state is URL-encoded on most store pages
+        if raw_state.startswith('%'):
+            raw_state = unquote(raw_state)
+        
+        return orjson.loads(raw_state)
+    
+    def _store_uuid_from_url(self, url):
+        """Decode the store UUID from the last path segment of a store URL"""
+        segment = urlparse(url).path.rstrip('/').split('/')[-1]
+        
         try:
-            print(f"🌐 Navigating to: {url}")
-            self.driver.get(url)
+            return str(uuid.UUID(segment))
+        except ValueError:
+            pass
+        
+        # Store URLs usually carry the UUID as unpadded URL-safe base64
+        try:
+            padded = segment + '=' * (-len(segment) % 4)
+            return str(uuid.UUID(bytes=base64.urlsafe_b64decode(padded)))
+        except ValueError:
+            return None
+    
+    def _find_store(self, state, url):
+        """Locate the store entry for this URL in the Redux state"""
+        store_map = (state.get('marketplace') or {}).get('storeMap') or state.get('stores') or {}
+        
+        store_uuid = self._store_uuid_from_url(url)
+        store = store_map.get(store_uuid) if store_uuid else None
+        if store is None and len(store_map) == 1:
+            store = next(iter(store_map.values()))
+        
+        # Some pages wrap the store payload in a 'data' envelope
+        if isinstance(store, dict) and isinstance(store.get('data'), dict):
+            store = store['data']
+        
+        return store or None
+    
+    def _extract_restaurant_name_from_json(self, store):
+        """Extract restaurant name from the store JSON"""
+        title = store.get('title') or ''
+        if isinstance(title, dict):
+            title = title.get('text') or ''
+        
+        name = title.strip() or "Unknown Restaurant"
+        logger.debug("🏪 Restaurant: %s", name)
+        return name
+    
+    def _iter_catalog_items(self, store):
+        """Yield raw catalog item dicts from every menu section of the store"""
+        for sections in (store.get('catalogSectionsMap') or {}).values():
+            for section in sections or []:
+                payload = (section.get('payload') or {}).get('standardItemsPayload') or {}
+                for item in payload.get('catalogItems') or []:
+                    yield item
+    
+    def _extract_menu_items_from_json(self, store):
+        """Extract all menu items from the store JSON"""
+        menu_items = []
+        seen_items = set()  # Items appear in several sections (e.g. "Popular")
+        
+        for item in self._iter_catalog_items(store):
+            name = (item.get('title') or '').strip()
+            if not name or name.casefold() in seen_items:
+                continue
+            seen_items.add(name.casefold())
+            
+            # Prices are given in cents
+            price = item.get('price')
+            image_url = item.get('imageUrl') or ''
+            
+            menu_items.append({
+                'index': len(menu_items),
+                'name': name,
+                'description': (item.get('itemDescription') or '').strip(),
+                'price': f"${price / 100:.2f}" if isinstance(price, (int, float)) else '',
+                'image_url': image_url,
+                'has_image': bool(image_url)
+            })
+        
+        self._mark_valid_images(menu_items)
+        return menu_items
+    
+    def _scrape_with_browser(self, url):
+        """
+        Scrape an Uber Eats restaurant page by rendering it with Selenium
+        
+        Args:
+            url (str): Uber Eats restaurant URL
+            
+        Returns:
+            dict: Scraped restaurant data including menu items
+        """
+        try:
+            if self.driver is None:
+                self._setup_driver()
             
-            # Wait for page to load and JavaScript to execute
-            time.sleep(5)
+            logger.info("🌐 Navigating to: %s", url)
+            self.driver.get(url)
             
-            # Simple popup handling
+            # Wait for the DOM to be parsed (menu items are awaited separately below)
             try:
-                close_button = self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Close"]')
-                if close_button.is_displayed():
-                    close_button.click()
-                    print("🚫 Closed popup")
-                    time.sleep(2)
-            except:
-                print("ℹ️ No popup found or couldn't close it")
+                WebDriverWait(self.driver, PAGE_READY_TIMEOUT, poll_frequency=WAIT_POLL_INTERVAL).until(
+                    lambda driver: driver.execute_script("return document.readyState") != "loading"
+                )
+            except TimeoutException:
+                logger.warning("⚠️ Timeout waiting for page to finish loading")
             
-            # Wait for menu items to be loaded dynamically
+            # Wait for menu items to be loaded dynamically (a JS probe returns a
+            # bool instead of serializing every matching element on each poll)
             try:
-                self.wait.until(lambda driver: len(driver.find_elements(By.CSS_SELECTOR, "a[href*='item']")) > 0)
-                print("✅ Menu items detected")
+                WebDriverWait(self.driver, MENU_WAIT_TIMEOUT, poll_frequency=WAIT_POLL_INTERVAL).until(
+                    lambda driver: driver.execute_script("return document.querySelector(arguments[0]) !== null", _ITEM_SELECTOR)
+                )
+                logger.debug("✅ Menu items detected")
             except TimeoutException:
-                print("⚠️ Timeout waiting for menu items to load")
+                logger.warning("⚠️ Timeout waiting for menu items to load")
+            
+            # The delivery/schedule modal only mounts once the app has rendered,
+            # and it blocks scrolling while open
+            self._close_popup()
             
             # Scroll to load more menu items (Uber Eats loads items dynamically)
             self._scroll_to_load_all_items()
@@ -107,15 +488,15 @@ class UberEatsScraper:
             restaurant_data = {
                 'url': url,
                 'restaurant_name': self._extract_restaurant_name(),
-                'menu_items': self._extract_menu_items(),
+                'menu_items': self._extract_menu_items(url),
                 'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
             }
             
-            print(f"✅ Successfully scraped {len(restaurant_data['menu_items'])} menu items")
+            logger.info("✅ Successfully scraped %d menu items", len(restaurant_data['menu_items']))
             return restaurant_data
             
         except Exception as e:
-            print(f"❌ Error scraping restaurant: {str(e)}")
+            logger.error("❌ Error scraping restaurant: %s", e)
             return {
                 'url': url,
                 'error': str(e),
@@ -126,318 +507,270 @@ class UberEatsScraper:
     def _extract_restaurant_name(self):
         """Extract restaurant name from the page"""
         try:
-            # Try multiple selectors for restaurant name
-            for selector in SELECTORS['restaurant_name'].split(', '):
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector.strip())
-                    name = element.text.strip()
-                    if name:
-                        print(f"🏪 Restaurant: {name}")
-                        return name
-                except NoSuchElementException:
-                    continue
+            # One round trip for all candidate selectors, first non-empty text wins
+            name = self.driver.execute_script(_FIRST_TEXT_JS, _NAME_SELECTORS)
+            if name:
+                logger.debug("🏪 Restaurant: %s", name)
+                return name
             
             # Fallback: try to get from page title
             title = self.driver.title
             if title and 'Uber Eats' in title:
                 name = title.replace('Uber Eats', '').strip()
-                print(f"🏪 Restaurant (from title): {name}")
+                logger.debug("🏪 Restaurant (from title): %s", name)
                 return name
                 
         except Exception as e:
-            print(f"⚠️ Could not extract restaurant name: {str(e)}")
+            logger.warning("⚠️ Could not extract restaurant name: %s", e)
         
         return "Unknown Restaurant"
     
-    def _handle_popups(self):
-        """Handle various popups that might block menu access"""
+    def _close_popup(self):
+        """Dismiss the popup that can cover the menu, in one round trip and without waiting"""
         try:
-            # Common popup selectors to try
-            popup_selectors = [
-                # Schedule delivery popup
-                'button[aria-label="Close"]',
-                'button[data-testid="close-button"]',
-                'button[class*="close"]',
-                '[data-testid="modal-close-button"]',
-                # X button in top-left corner
-                'button[class*="close-button"]',
-                # Generic close buttons
-                'button[class*="dismiss"]',
-                'button[class*="cancel"]',
-                # Generic buttons
-                'button[type="button"]'
-            ]
-            
-            # Text-based selectors (need to be handled differently)
-            text_selectors = [
-                ('button', 'Cancel'),
-                ('button', 'Close'),
-                ('button', '×'),
-                ('div', '×'),
-                ('span', '×')
-            ]
-            
-            # Try to find and close popups with CSS selectors
-            for selector in popup_selectors:
-                try:
-                    # Look for close buttons
-                    close_buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for button in close_buttons:
-                        if button.is_displayed() and button.is_enabled():
-                            print(f"🚫 Found popup, attempting to close with selector: {selector}")
-                            button.click()
-                            time.sleep(1)  # Wait for popup to close
-                            break
-                except Exception:
-                    continue
-            
-            # Try to find and close popups with text-based selectors
-            for tag, text in text_selectors:
-                try:
-                    elements = self.driver.find_elements(By.TAG_NAME, tag)
-                    for element in elements:
-                        if element.text.strip() == text and element.is_displayed() and element.is_enabled():
-                            print(f"🚫 Found popup, attempting to close with text: {text}")
-                            element.click()
-                            time.sleep(1)  # Wait for popup to close
-                            break
-                except Exception:
-                    continue
-            
-            # Try pressing Escape key as fallback
-            try:
-                from selenium.webdriver.common.keys import Keys
-                self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                time.sleep(1)
-                print("🚫 Attempted to close popup with Escape key")
-            except Exception:
-                pass
-            
-            # Additional wait for any animations to complete
-            time.sleep(2)
-            
+            if self.driver.execute_script(_CLOSE_POPUP_JS):
+                logger.debug("🚫 Closed popup")
+            else:
+                logger.debug("ℹ️ No popup found")
         except Exception as e:
-            print(f"⚠️ Error handling popups: {str(e)}")
+            logger.warning("⚠️ Couldn't close popup: %s", e)
+    
+    def _count_items(self) -> int:
+        """Count menu item links in page JS rather than fetching every element handle"""
+        return self.driver.execute_script(_COUNT_ITEMS_JS, _ITEM_SELECTOR)
+    
+    def _scroll_and_count(self, prev_count: int, timeout: float) -> int:
+        """
+        Scroll to the bottom and wait for new menu items in one CDP call
+        
+        Args:
+            prev_count (int): Item count before this scroll
+            timeout (float): Max seconds to wait for the count to change
+            
+        Returns:
+            int: Item count after the scroll (equal to prev_count if nothing loaded)
+        """
+        expression = _SCROLL_AND_COUNT_JS % {
+            'selector': _ITEM_SELECTOR_JS,
+            'prev_count': prev_count,
+            'timeout_ms': timeout * 1000,
+            'poll_ms': WAIT_POLL_INTERVAL * 1000,
+        }
+        result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True,
+        })
+        return result['result']['value']
     
     def _scroll_to_load_all_items(self):
         """Scroll through the page to load all menu items dynamically"""
         try:
-            print("📜 Scrolling to load all menu items...")
+            logger.debug("📜 Scrolling to load all menu items...")
             
             # Get initial count
-            initial_count = len(self.driver.find_elements(By.CSS_SELECTOR, "a[href*='item']"))
-            print(f"📋 Initial menu items found: {initial_count}")
+            initial_count = self._count_items()
+            logger.debug("📋 Initial menu items found: %d", initial_count)
             
             # If we already have items, try a few scrolls to ensure we get everything
             if initial_count > 0:
-                for i in range(3):  # Just 3 scrolls should be enough
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                    new_count = len(self.driver.find_elements(By.CSS_SELECTOR, "a[href*='item']"))
-                    print(f"📜 Scroll {i + 1}: Found {new_count} items")
-                
-                # Scroll back to top
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
+                # Back off between scrolls and stop once a scroll loads nothing new
+                prev_count = initial_count
+                for i, delay in enumerate(SCROLL_BACKOFF_DELAYS):
+                    new_count = self._scroll_and_count(prev_count, delay)
+                    if new_count == prev_count:
+                        logger.debug("📜 Scroll %d: No new items, done scrolling", i + 1)
+                        break
+                    logger.debug("📜 Scroll %d: Found %d items", i + 1, new_count)
+                    prev_count = new_count
             
-            final_count = len(self.driver.find_elements(By.CSS_SELECTOR, "a[href*='item']"))
-            print(f"✅ Final menu items found: {final_count}")
+            # The final count costs a round trip, so only take it for debug output
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Final menu items found: %d", self._count_items())
             
         except Exception as e:
-            print(f"⚠️ Error scrolling to load items: {str(e)}")
+            logger.warning("⚠️ Error scrolling to load items: %s", e)
     
-    def _extract_menu_items(self):
-        """Extract all menu items from the current page"""
+    def _extract_menu_items(self, page_url):
+        """Extract all menu items from the current page, resolving image URLs against page_url"""
         menu_items = []
         seen_items = set()  # Track seen items to avoid duplicates
         
         try:
-            # Try to find menu items using different selectors
-            item_elements = []
-            
-            for selector in SELECTORS['menu_items'].split(', '):
+            # Pull text and image of all menu items in one WebDriver call
+            rows = self.driver.execute_script(_ITEM_ROWS_JS, _ITEM_SELECTOR, None, _SKIP_PREFIXES)
+            source = _ITEM_SELECTOR
+            
+            if not rows:
+                logger.debug("⚠️ No menu items found with configured selectors")
+                # Fall back to menu-like containers, capped in the browser so only 50 rows cross the wire
+                source = "div[class*='menu'], article[class*='menu'], section[class*='menu']"
+                rows = self.driver.execute_script(_ITEM_ROWS_JS, source, 50, _SKIP_PREFIXES)
+            
+            # Parse each item's text in pure Python
+            for i, (full_text, image_url, index) in enumerate(rows):
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector.strip())
-                    if elements:
-                        item_elements = elements
-                        print(f"📋 Found {len(elements)} menu items using selector: {selector}")
-                        break
-                except Exception:
-                    continue
-            
-            if not item_elements:
-                print("⚠️ No menu items found with configured selectors")
-                # Try a more specific approach first
-                item_elements = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='menu'], article[class*='menu'], section[class*='menu']")
-                if not item_elements:
-                    # Last resort: try generic approach but limit to reasonable number
-                    item_elements = self.driver.find_elements(By.CSS_SELECTOR, "div, article, section")[:50]  # Limit to first 50
-                print(f"🔍 Trying fallback approach, found {len(item_elements)} potential elements")
-            
-            # Extract details from each menu item
-            for i, element in enumerate(item_elements):
-                try:
-                    item_data = self._extract_item_details(element, i)
-                    if item_data and item_data.get('name'):
-                        # Check for duplicates based on name
-                        item_name = item_data['name'].strip()
-                        if item_name not in seen_items:
-                            seen_items.add(item_name)
-                            menu_items.append(item_data)
-                            # Reduced logging for performance
-                            if len(menu_items) % 20 == 0:  # Log every 20 items
-                                print(f"📋 Processed {len(menu_items)} items...")
-                        # Skip duplicates silently
-                    
-                    # Process all items (removed performance limit)
+                    # Duplicates (by name) come back as None before being fully parsed
+                    item_data = self._extract_item_details(full_text, image_url, index, seen_items, page_url)
+                    if item_data:
+                        menu_items.append(item_data)
+                        # Skip formatting the progress line entirely when INFO is off
+                        if len(menu_items) % 20 == 0 and logger.isEnabledFor(logging.INFO):
+                            logger.info("📋 Processed %d items...", len(menu_items))
                         
                 except Exception as e:
                     # Only log errors for first few items to avoid spam
                     if i < 5:
-                        print(f"⚠️ Error extracting item {i}: {str(e)}")
+                        logger.debug("⚠️ Error extracting item %d: %s", i, e)
                     continue
             
+            logger.info("📋 Parsed %d menu items from %d elements matching: %s", len(menu_items), len(rows), source)
+            
         except Exception as e:
-            print(f"❌ Error extracting menu items: {str(e)}")
+            logger.error("❌ Error extracting menu items: %s", e)
         
+        self._mark_valid_images(menu_items)
         return menu_items
     
-    def _extract_item_details(self, element, index):
-        """Extract details from individual menu item element - optimized for speed"""
-        try:
-            # Get text content with proper line breaks
-            full_text = self.driver.execute_script("""
-                var text = '';
-                var walker = document.createTreeWalker(
-                    arguments[0],
-                    NodeFilter.SHOW_TEXT,
-                    null,
-                    false
-                );
-                var node;
-                while (node = walker.nextNode()) {
-                    text += node.textContent + '\\n';
-                }
-                return text;
-            """, element)
-            
-            if not full_text.strip():
-                return None
-            
-            # Clean up and split lines
-            lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-            
-            # Find price quickly
-            price = ""
-            name = ""
-            description_parts = []
-            
-            # First pass: find price
-            for line in lines:
-                if '$' in line and not price:
-                    try:
-                        price_part = line.split('$')[1].split('•')[0].strip()
-                        price = f"${price_part}"
-                        break
-                    except:
-                        pass
-            
-            # Second pass: find name and description
-            for line in lines:
-                if (not line.startswith('$') and 
-                    not line.startswith('#') and 
-                    not line.startswith('Popular') and 
-                    not line.startswith('most liked') and 
-                    not line.startswith('Plus small') and  # Skip size options
-                    len(line) > 1):
-                    if not name:  # First non-price line is the name
-                        name = line
-                    elif line != name:  # Subsequent lines are description
-                        description_parts.append(line)
-            
-            if not name and lines:
-                name = lines[0]  # Fallback
-            
-            if not name:
-                return None
-            
-            # Extract image URL quickly
-            image_url = ""
-            try:
-                image_url = self.driver.execute_script("return arguments[0].querySelector('img')?.src || '';", element)
-            except:
-                pass
-            
-            return {
-                'index': index,
-                'name': name,
-                'description': ' • '.join(description_parts) if description_parts else '',
-                'price': price,
-                'image_url': image_url,
-                'has_image': bool(image_url),
-                'image_valid': bool(image_url)
-            }
-            
-        except Exception:
+    def _extract_item_details(self, full_text: str, image_url: str, index: int, seen_items: set[str], page_url: str) -> Optional[dict]:
+        """
+        Build a menu item from its extracted text and raw image src
+        
+        index is the element's position among the matched item elements.
+        Relative and protocol-relative image sources are resolved against
+        page_url. Returns None for empty items and for names already in
+        seen_items; new names are added to seen_items.
+        """
+        parsed = _parse_lines(full_text, seen_items)
+        if parsed is None:
             return None
-    
-    def _validate_image_fast(self, image_url):
-        """Fast image validation without HTTP requests"""
-        if not image_url:
-            return False
-        
-        # Check for placeholder patterns
-        url_lower = image_url.lower()
-        for pattern in PLACEHOLDER_PATTERNS:
-            if pattern in url_lower:
-                return False
-        
-        # Check for common placeholder URLs
-        placeholder_urls = [
-            'data:image',
-            'placeholder',
-            'default',
-            'no-image',
-            'null',
-            'undefined'
-        ]
         
-        for placeholder in placeholder_urls:
-            if placeholder in url_lower:
-                return False
+        name, price, description = parsed
+        if image_url:
+            image_url = urljoin(page_url, image_url)
+        return {
+            'index': index,
+            'name': name,
+            'description': description,
+            'price': price,
+            'image_url': image_url,
+            'has_image': bool(image_url)
+        }
+    
+    def _mark_valid_images(self, menu_items):
+        """Set 'image_valid' on every item with one batch validation pass"""
+        valid = self._validate_images([item['image_url'] for item in menu_items])
+        for item, image_valid in zip(menu_items, valid):
+            item['image_valid'] = image_valid
+    
+    def _validate_images(self, image_urls: list[str]) -> list[bool]:
+        """
+        Fast image validation without HTTP requests, for a batch of URLs
         
-        # For Uber Eats images, if they have the proper domain and structure, consider them valid
-        # This is much faster than HTTP requests and works for 99% of cases
-        if 'tb-static.uber.com' in image_url and 'processed_images' in image_url:
-            return True
+        Args:
+            image_urls (list): Image URLs (empty strings for missing images)
+            
+        Returns:
+            list: One bool per URL
+        """
+        is_placeholder = _PLACEHOLDER_RE.search
+        has_image_ext = _IMAGE_EXT_RE.search
+        is_uber_cdn_image = _UBER_CDN_IMAGE_RE.search
         
-        # For other domains, check if URL looks like a real image
-        if any(ext in url_lower for ext in ['.jpg', '.jpeg', '.png', '.webp', '.gif']):
-            return True
+        return [
+            bool(image_url)
+            # Reject placeholder and inline data URLs
+            and is_placeholder(image_url) is None
+            # Uber Eats CDN images are valid by structure; otherwise require an image extension
+            and (is_uber_cdn_image(image_url) is not None
+                 or has_image_ext(image_url) is not None)
+            for image_url in image_urls
+        ]
+    
+    def scrape_many(self, urls):
+        """
+        Scrape several restaurants, reusing this scraper's WebDriver between them
         
-        return False
+        Args:
+            urls (list): Uber Eats restaurant URLs
+            
+        Returns:
+            list: Scraped restaurant data for each URL, in order
+        """
+        results = []
+        for url in urls:
+            results.append(self.scrape_restaurant(url))
+            # Cookies are cleared between stores; the HTTP cache is kept so
+            # shared Uber Eats JS bundles are not downloaded again
+            self.reset()
+        return results
+    
+    def reset(self):
+        """Clear browser session state so the scraper can be reused for another store"""
+        if self.driver:
+            try:
+                self.driver.delete_all_cookies()
+            except Exception as e:
+                # Driver is unusable; drop it so the next browser scrape starts a fresh one
+                logger.warning("⚠️ Could not reset WebDriver: %s", e)
+                try:
+                    self.close()
+                except Exception:
+                    self.driver = None
     
     def close(self):
         """Clean up WebDriver resources"""
         if self.driver:
             self.driver.quit()
-            print("🔒 WebDriver closed")
+            self.driver = None
+            logger.debug("🔒 WebDriver closed")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _scrape_in_worker(url):
+    """Scrape one restaurant in a worker process with its own Chrome profile"""
+    with tempfile.TemporaryDirectory(prefix='ubereats-chrome-') as user_data_dir:
+        with UberEatsScraper(user_data_dir=user_data_dir) as scraper:
+            return scraper.scrape_restaurant(url)
+
+
+def scrape_urls_parallel(urls, workers=4):
+    """
+    Scrape several restaurants in parallel worker processes
+    
+    Args:
+        urls (list): Uber Eats restaurant URLs
+        workers (int): Number of worker processes (each may run one Chrome)
+        
+    Yields:
+        dict: Scraped restaurant data, in completion order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_scrape_in_worker, url) for url in urls]
+        for future in as_completed(futures):
+            yield future.result()
 
 
 def main():
     """Test function for command line usage"""
     import sys
     
-    if len(sys.argv) != 2:
-        print("Usage: python scraper.py <uber_eats_url>")
+    if len(sys.argv) < 2:
+        print("Usage: python scraper.py <uber_eats_url> [<uber_eats_url> ...]")
         sys.exit(1)
     
-    url = sys.argv[1]
-    scraper = UberEatsScraper()
+    urls = sys.argv[1:]
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    try:
-        result = scraper.scrape_restaurant(url)
-        
+    with UberEatsScraper() as scraper:
+        results = scraper.scrape_many(urls)
+    
+    for result in results:
         print("\n" + "="*50)
         print(f"RESTAURANT: {result['restaurant_name']}")
         print(f"URL: {result['url']}")
@@ -455,9 +788,6 @@ def main():
                 print(f"   🖼️  {status}: {item['image_url']}")
             else:
                 print(f"   🖼️  ❌ No image")
-        
-    finally:
-        scraper.close()
 
 
 if __name__ == "__main__":
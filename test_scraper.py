@@ -4,8 +4,10 @@ Test script for Uber Eats scraper
 Usage: python test_scraper.py <uber_eats_url>
 """
 
+import logging
 import sys
-import json
+
+import orjson
 from scraper import UberEatsScraper
 
 
@@ -81,8 +83,8 @@ def test_scraper(url):
         
         # Save results to JSON file
         output_file = "scraping_results.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         print(f"\n💾 Results saved to: {output_file}")
         
     except Exception as e:
@@ -113,6 +115,7 @@ def main():
             print("Test cancelled.")
             sys.exit(1)
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     test_scraper(url)
 
 
@@ -0,0 +1,27 @@
+"""
+Smoke tests for the Quart app: it imports and serves without Redis or Chrome
+
+Run with: python -m pytest tests
+"""
+
+import asyncio
+
+import orjson
+
+
+def test_app_imports():
+    import app
+
+    assert app.app is not None
+
+
+def test_health_endpoint():
+    from app import app
+
+    async def get_health():
+        response = await app.test_client().get('/api/health')
+        return response.status_code, await response.get_data()
+
+    status_code, body = asyncio.run(get_health())
+    assert status_code == 200
+    assert orjson.loads(body)['status'] == 'healthy'
@@ -0,0 +1,126 @@
+"""
+Offline tests for the store JSON path and menu text parsing
+
+Run with: python -m pytest tests
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scraper import UberEatsScraper, _parse_lines
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+STORE_UUID = '6ac9f3fa-b3b2-420d-8bac-6721ad6b6ac2'
+STORE_URL = 'https://www.ubereats.com/ca/store/bao-housenorth-york/asnz-rOyQg2LrGchrWtqwg'
+
+
+@pytest.fixture
+def scraper():
+    return UberEatsScraper()
+
+
+@pytest.fixture
+def store_state(scraper):
+    html = (FIXTURES / 'store_page.html').read_text(encoding='utf-8')
+    return scraper._parse_store_state(html)
+
+
+def test_store_uuid_from_base64_segment(scraper):
+    assert scraper._store_uuid_from_url(STORE_URL) == STORE_UUID
+
+
+def test_store_uuid_from_dashed_segment(scraper):
+    url = f'https://www.ubereats.com/ca/store/bao-house/{STORE_UUID}/'
+    assert scraper._store_uuid_from_url(url) == STORE_UUID
+
+
+def test_store_uuid_from_unrelated_segment(scraper):
+    assert scraper._store_uuid_from_url('https://www.ubereats.com/ca/store/bao-house') is None
+
+
+def test_parse_store_state_decodes_url_encoded_blob(store_state):
+    assert STORE_UUID in store_state['stores']
+
+
+def test_parse_store_state_without_state_raises(scraper):
+    with pytest.raises(ValueError):
+        scraper._parse_store_state('<html><body></body></html>')
+
+
+def test_find_store_unwraps_data_envelope(scraper, store_state):
+    store = scraper._find_store(store_state, STORE_URL)
+    assert store['uuid'] == STORE_UUID
+
+
+def test_restaurant_data_from_store_page(scraper, store_state):
+    result = scraper._restaurant_data_from_state(STORE_URL, store_state)
+
+    assert result['url'] == STORE_URL
+    assert result['restaurant_name'] == 'Bao House'
+
+    items = result['menu_items']
+    # "PORK BAO" repeats "Pork Bao" from the Popular section
+    assert [item['name'] for item in items] == ['Pork Bao', 'Bubble Tea', 'Chicken Bao', 'Seasonal Special']
+    assert [item['index'] for item in items] == [0, 1, 2, 3]
+
+    # Prices are given in cents
+    assert [item['price'] for item in items] == ['$5.99', '$4.50', '$10.00', '']
+
+    assert items[2]['description'] == 'Fried chicken, spicy mayo'
+    assert [item['has_image'] for item in items] == [True, False, True, False]
+    assert [item['image_valid'] for item in items] == [True, False, False, False]
+
+
+def test_restaurant_data_without_matching_store(scraper):
+    state = {'stores': {}}
+    assert scraper._restaurant_data_from_state(STORE_URL, state) is None
+
+
+def test_parse_lines_splits_name_price_description():
+    text = '#1 most liked\nPork Bao\n$5.99 • 540 Cal.\nBraised pork belly\n'
+    assert _parse_lines(text, set()) == ('Pork Bao', '$5.99', 'Braised pork belly')
+
+
+def test_parse_lines_takes_first_price():
+    text = 'Combo\n$12 • Serves 2\n$15.50'
+    assert _parse_lines(text, set()) == ('Combo', '$12', '')
+
+
+def test_parse_lines_keeps_thousands_separators():
+    text = 'Party Platter\n$1,299.00 • Serves 40'
+    assert _parse_lines(text, set()) == ('Party Platter', '$1,299.00', '')
+
+
+def test_parse_lines_ignores_dollar_without_amount():
+    text = 'Gift Card\n$ amount of your choice\n$25.00'
+    assert _parse_lines(text, set()) == ('Gift Card', '$25.00', '')
+
+
+def test_parse_lines_skips_casefolded_duplicates():
+    seen = set()
+    assert _parse_lines('Pork Bao\n$5.99', seen) is not None
+    assert _parse_lines('Popular\nPORK BAO\n$5.99', seen) is None
+    assert seen == {'pork bao'}
+
+
+def test_parse_lines_falls_back_to_first_line():
+    assert _parse_lines('$5.99', set()) == ('$5.99', '$5.99', '')
+
+
+def test_parse_lines_empty_text():
+    assert _parse_lines(' \n \n', set()) is None
+
+
+@pytest.mark.parametrize('src, expected', [
+    ('https://tb-static.uber.com/prod/a.jpeg', 'https://tb-static.uber.com/prod/a.jpeg'),
+    ('//tb-static.uber.com/prod/a.jpeg', 'https://tb-static.uber.com/prod/a.jpeg'),
+    ('/_static/a.png', 'https://www.ubereats.com/_static/a.png'),
+    ('img/a.png', 'https://www.ubereats.com/ca/store/bao-housenorth-york/img/a.png'),
+    ('', ''),
+])
+def test_extract_item_details_resolves_image_src(scraper, src, expected):
+    item = scraper._extract_item_details('Pork Bao\n$5.99', src, 0, set(), STORE_URL)
+    assert item['image_url'] == expected
+    assert item['has_image'] is bool(expected)